@@ -0,0 +1,133 @@
+import os
+import json
+import time
+import threading
+import weatherapi
+from PyQt6.QtCore import QObject, QStandardPaths, pyqtSignal
+
+MIN_INTERVAL = 30 * 60
+BASE_INTERVAL = 60 * 60
+MAX_INTERVAL = 6 * 60 * 60
+RETRY_INTERVAL = 15 * 60
+STARTUP_SPACING = 20
+
+def state_path():
+    base = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.GenericDataLocation)
+    return os.path.join(base, "Weather4You", "alerts.json")
+
+class WatchedLocation:
+    __slots__ = ("city", "interval", "next_poll", "etag", "failures")
+
+    def __init__(self, city, next_poll):
+        self.city = city
+        # Doubled by the first quiet poll, so a new location settles at BASE_INTERVAL.
+        self.interval = BASE_INTERVAL // 2
+        self.next_poll = next_poll
+        self.etag = None
+        self.failures = 0
+
+class AlertWatcher(QObject):
+    alert_raised = pyqtSignal(str, object)
+
+    def __init__(self, language="RU", path=None):
+        super().__init__()
+        self.language = language
+        self.path = path or state_path()
+        self.locations = {}
+        self.lock = threading.Lock()
+        self.wake = threading.Event()
+        self.stopped = False
+        self.thread = None
+        self.known = self.load()
+
+    def load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                known = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return known if isinstance(known, dict) else {}
+
+    def save(self):
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(self.path, "w", encoding="utf-8") as f:
+                json.dump(self.known, f, ensure_ascii=False)
+        except OSError:
+            pass
+
+    def set_language(self, language):
+        self.language = language
+
+    def set_locations(self, cities):
+        now = time.monotonic()
+        watched = {}
+        for city in weatherapi.unique_cities(cities):
+            watched.setdefault(city.lower(), city)
+        with self.lock:
+            for key in list(self.locations):
+                if key not in watched:
+                    del self.locations[key]
+            # New locations are spread out so a long list does not poll in one burst.
+            for key, city in watched.items():
+                if key not in self.locations:
+                    self.locations[key] = WatchedLocation(city, now + len(self.locations) * STARTUP_SPACING)
+        self.wake.set()
+
+    def start(self):
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.run, name="alert-watcher", daemon=True)
+            self.thread.start()
+
+    def stop(self):
+        self.stopped = True
+        self.wake.set()
+
+    def next_due(self):
+        with self.lock:
+            if not self.locations:
+                return None
+            return min(self.locations.values(), key=lambda location: location.next_poll)
+
+    def run(self):
+        while not self.stopped:
+            location = self.next_due()
+            delay = None if location is None else location.next_poll - time.monotonic()
+            if delay is None or delay > 0:
+                self.wake.wait(delay)
+                self.wake.clear()
+                continue
+            self.poll(location)
+
+    def poll(self, location):
+        key = location.city.lower()
+        try:
+            alerts, etag = weatherapi.fetch_alerts(location.city, self.language, location.etag)
+        except Exception:
+            # Errors like 401 or 429 do not go away on their own, so retries back off as well.
+            delay = min(RETRY_INTERVAL * 2 ** location.failures, MAX_INTERVAL)
+            location.failures += 1
+            location.next_poll = time.monotonic() + delay
+            return
+
+        location.failures = 0
+        location.etag = etag
+        known = self.known.get(key, {})
+        changed = False
+        if alerts is not None:
+            current = {alert.alert_id: alert.revision for alert in alerts}
+            for alert in alerts:
+                if known.get(alert.alert_id) != alert.revision:
+                    changed = True
+                    self.alert_raised.emit(location.city, alert)
+            if current != known:
+                self.known[key] = current
+                self.save()
+            known = current
+
+        # Poll often while alerts are active, back off while nothing happens.
+        if changed or known:
+            location.interval = MIN_INTERVAL
+        else:
+            location.interval = min(location.interval * 2, MAX_INTERVAL)
+        location.next_poll = time.monotonic() + location.interval
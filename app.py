@@ -1,39 +1,30 @@
-from searchscreen import SearchScreen
-from weatherscreen import ShowWeather
 import sys
-import os
-from PyQt6.QtWidgets import (QApplication, QStackedWidget)
+from instance import SingleInstance
 
-@staticmethod
-def resource_path(relative):
-    if hasattr(sys, "_MEIPASS"):
-        return os.path.join(sys._MEIPASS, relative)
-    return os.path.join(relative)
+def main():
+    # Hand the arguments to a running instance before paying for QApplication
+    # and the screen imports; QLocalSocket works without an application object.
+    instance = SingleInstance()
+    if instance.send(sys.argv[1:]):
+        return 0
 
-class WeatherApp(QStackedWidget):
-    def __init__(self):
-        super().__init__()
-        self.setWindowTitle('Weather4You')
-        self.setGeometry(100, 100, 1200, 740)
-        self.center()
-        self.search_screen = SearchScreen(self)
-        self.addWidget(self.search_screen)
-        self.weatherscreen = ShowWeather(self,self.search_screen)
-        self.addWidget(self.weatherscreen)
-        self.setCurrentIndex(0)
-        style_path = resource_path("style.qss")
-        with open(style_path, "r") as file:
-            self.setStyleSheet(file.read())
+    from PyQt6.QtWidgets import QApplication, QSystemTrayIcon
 
-    def center(self):
-        screen = QApplication.primaryScreen()  
-        screen_geometry = screen.availableGeometry()  
-        window_geometry = self.frameGeometry() 
-        center_point = screen_geometry.center()
-        window_geometry.moveCenter(center_point)
-        self.move(window_geometry.topLeft())
+    # Claim the server name before the slow screen imports; when another
+    # launch got there first, this one becomes the secondary after all.
+    app = QApplication(sys.argv)
+    arguments = app.arguments()[1:]
+    if not instance.listen() and instance.send(arguments):
+        return 0
 
-app = QApplication(sys.argv)
-window = WeatherApp()
-window.show()
-app.exec()
\ No newline at end of file
+    from mainwindow import WeatherApp
+
+    resident = QSystemTrayIcon.isSystemTrayAvailable()
+    app.setQuitOnLastWindowClosed(not resident)
+    window = WeatherApp(resident=resident)
+    instance.message_received.connect(window.handle_arguments)
+    window.handle_arguments(arguments)
+    return app.exec()
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+import os
+import sys
+import json
+import time
+import datetime
+import statistics
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models import ForecastSeries
+
+CITIES = 1000
+ROUNDS = 5
+
+
+def onecall_payload(seed):
+    start = 1760000000 + seed * 3600
+    day = {
+        "sunrise": start + 20000, "sunset": start + 60000, "moonrise": start + 30000,
+        "moonset": start + 70000, "moon_phase": 0.5, "summary": "Expect a day of partly cloudy with rain",
+        "feels_like": {"day": 11.2, "night": 4.1, "eve": 8.3, "morn": 3.9},
+        "pressure": 1016, "dew_point": 4.5, "clouds": 75, "pop": 0.4, "rain": 1.2, "uvi": 1.8
+    }
+    daily = []
+    for i in range(8):
+        daily.append(dict(day, dt=start + i * 86400, humidity=60 + i, wind_speed=3.5 + i / 10,
+                          wind_deg=200, wind_gust=7.1,
+                          temp={"day": 12.5 + seed % 10 + i, "min": 3.1, "max": 14.2,
+                                "night": 4.4 + i, "eve": 9.8, "morn": 3.5},
+                          weather=[{"id": 500, "main": "Rain", "description": "небольшой дождь", "icon": "10d"}]))
+    return json.dumps({
+        "lat": 55.75, "lon": 37.62, "timezone": "Europe/Moscow", "timezone_offset": 10800,
+        "current": {"dt": start, "sunrise": start + 20000, "sunset": start + 60000, "temp": 10.3,
+                    "feels_like": 8.9, "pressure": 1015, "humidity": 71, "dew_point": 5.2, "uvi": 0.9,
+                    "clouds": 75, "visibility": 10000, "wind_speed": 4.1, "wind_deg": 210,
+                    "weather": [{"id": 803, "main": "Clouds", "description": "облачно с прояснениями",
+                                 "icon": "04d"}]},
+        "daily": daily
+    }).encode("utf-8")
+
+
+def dict_forecast(city, data):
+    # The parser used before models.ForecastSeries existed.
+    forecast_data = {
+        "city": city,
+        "current": {
+            "temp": data["current"]["temp"],
+            "feels_like": data["current"]["feels_like"],
+            "humidity": data["current"]["humidity"],
+            "wind": data["current"]["wind_speed"],
+            "description": data["current"]["weather"][0]["description"],
+            "icon": data["current"]["weather"][0]["icon"]
+        },
+        "daily": []
+    }
+    for day in data["daily"][:7]:
+        forecast_data["daily"].append({
+            "date": datetime.datetime.fromtimestamp(day["dt"]).strftime("%d.%m"),
+            "day_name": datetime.datetime.fromtimestamp(day["dt"]).strftime("%A"),
+            "temp_day": day["temp"]["day"],
+            "temp_night": day["temp"]["night"],
+            "description": day["weather"][0]["description"],
+            "icon": day["weather"][0]["icon"],
+            "humidity": day["humidity"],
+            "wind": day["wind_speed"]
+        })
+    return forecast_data
+
+
+def series_forecast(city, data):
+    return ForecastSeries.from_onecall(city, data)
+
+
+def parse_all(build, payloads):
+    return [build(f"city {i}", json.loads(payload)) for i, payload in enumerate(payloads)]
+
+
+def measure_time(build, payloads):
+    timings = []
+    for _ in range(ROUNDS):
+        started = time.perf_counter()
+        parse_all(build, payloads)
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+def measure_memory(build, payloads):
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    results = parse_all(build, payloads)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    retained = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del results
+    return retained / len(payloads)
+
+
+def main():
+    payloads = [onecall_payload(seed) for seed in range(CITIES)]
+    decoded = [json.loads(payload) for payload in payloads]
+
+    print(f"{CITIES} One Call responses, median of {ROUNDS} rounds")
+    for name, build in [("dict", dict_forecast), ("ForecastSeries", series_forecast)]:
+        total = measure_time(build, payloads)
+        started = time.perf_counter()
+        for i, data in enumerate(decoded):
+            build(f"city {i}", data)
+        build_only = time.perf_counter() - started
+        per_city = measure_memory(build, payloads)
+        print(f"{name:<15} parse+build {total * 1e6 / CITIES:7.1f} us/city   "
+              f"build only {build_only * 1e6 / CITIES:6.1f} us/city   "
+              f"retained {per_city:7.0f} bytes/city")
+
+
+if __name__ == "__main__":
+    main()
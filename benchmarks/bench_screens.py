@@ -0,0 +1,64 @@
+import os
+import sys
+import time
+import statistics
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt6.QtWidgets import QApplication
+
+ROUNDS = 20
+
+
+def measure(callback, rounds=ROUNDS):
+    timings = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        callback()
+        QApplication.processEvents()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings), min(timings)
+
+
+def main():
+    app = QApplication(sys.argv)
+    from mainwindow import WeatherApp
+
+    windows = []
+
+    def construct():
+        if windows:
+            windows.pop().deleteLater()
+        window = WeatherApp()
+        window.show()
+        windows.append(window)
+
+    def construct_screens():
+        window = windows[-1]
+        from searchscreen import SearchScreen
+        from weatherscreen import ShowWeather
+        search_screen = SearchScreen(window)
+        weatherscreen = ShowWeather(window, search_screen)
+        weatherscreen.ensurePolished()
+        search_screen.deleteLater()
+        weatherscreen.deleteLater()
+
+    def switch_language():
+        combo = windows[-1].search_screen.language_combo
+        combo.setCurrentText("EN" if combo.currentText() == "RU" else "RU")
+
+    construct()
+    for name, callback in [("WeatherApp construction + show", construct),
+                           ("SearchScreen + ShowWeather construction", construct_screens),
+                           ("language switch", switch_language)]:
+        median, best = measure(callback)
+        print(f"{name:<42} median {median:8.2f} ms   min {best:8.2f} ms")
+
+    windows[-1].close()
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+import os
+import sys
+import time
+import statistics
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from forecaststats import ForecastMatrix, FIELDS, DAYS
+
+ROUNDS = 50
+
+
+def synthetic_matrix(cities, seed=0):
+    rng = np.random.default_rng(seed)
+    base = rng.uniform(-20, 30, size=(cities, 1))
+    values = np.stack([
+        base + rng.normal(0, 3, size=(cities, DAYS)),
+        base - 7 + rng.normal(0, 3, size=(cities, DAYS)),
+        rng.uniform(20, 100, size=(cities, DAYS)),
+        rng.uniform(0, 15, size=(cities, DAYS))
+    ])
+    return ForecastMatrix([f"city {i}" for i in range(cities)], values,
+                          [f"{day + 1:02d}.01" for day in range(DAYS)])
+
+
+def recompute(matrix, history_mean):
+    for field in FIELDS:
+        matrix.daily_stats(field)
+        matrix.city_stats(field)
+    matrix.day_night_range()
+    matrix.warmest_per_day()
+    matrix.anomalies(history_mean)
+
+
+def main():
+    for cities in (10, 100, 500, 5000):
+        matrix = synthetic_matrix(cities)
+        history_mean = np.nanmean(matrix.field("temp_day"), axis=1) + 1
+        timings = []
+        for _ in range(ROUNDS):
+            started = time.perf_counter()
+            recompute(matrix, history_mean)
+            timings.append((time.perf_counter() - started) * 1000)
+        print(f"{cities:>5} cities: median {statistics.median(timings):7.3f} ms   min {min(timings):7.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+import os
+import sys
+import glob
+import shutil
+import argparse
+import subprocess
+from xml.sax.saxutils import escape
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtGui import QGuiApplication, QImage
+from PyQt6.QtCore import Qt
+from resources import RESOURCE_FILE, BACKGROUNDS_DIR, BACKGROUND_WIDTHS
+
+BUILD_DIR = os.path.join("build", "resources")
+STATIC_FILES = [
+    "style.qss",
+    "sources/fonts/try-clother.ttf",
+    "sources/icons/home.png",
+    "sources/icons/location.png"
+]
+JPEG_QUALITY = 85
+
+
+def find_rcc(explicit=None):
+    if explicit:
+        return [explicit]
+    if rcc := shutil.which("rcc"):
+        return [rcc]
+    if rcc := shutil.which("pyside6-rcc"):
+        return [rcc]
+    return None
+
+
+def build_backgrounds():
+    files = {}
+    os.makedirs(os.path.join(BUILD_DIR, BACKGROUNDS_DIR), exist_ok=True)
+    for source in sorted(glob.glob(os.path.join(BACKGROUNDS_DIR, "*.jpg"))):
+        name = os.path.splitext(os.path.basename(source))[0]
+        image = QImage(source)
+        if image.isNull():
+            raise RuntimeError(f"cannot decode {source}")
+
+        for width in BACKGROUND_WIDTHS:
+            if width >= image.width():
+                continue
+            target = os.path.join(BUILD_DIR, BACKGROUNDS_DIR, f"{name}_{width}.jpg")
+            scaled = image.scaledToWidth(width, Qt.TransformationMode.SmoothTransformation)
+            if not scaled.save(target, "JPG", JPEG_QUALITY):
+                raise RuntimeError(f"cannot write {target}")
+            files[f"{BACKGROUNDS_DIR}/{name}_{width}.jpg"] = target
+
+        # The original is kept as the largest variant, re-encoding it would only lose quality.
+        files[f"{BACKGROUNDS_DIR}/{name}_{image.width()}.jpg"] = source
+    return files
+
+
+def write_qrc(files):
+    qrc_path = os.path.join(BUILD_DIR, "resources.qrc")
+    lines = ['<!DOCTYPE RCC>', '<RCC version="1.0">', '<qresource prefix="/">']
+    for alias, source in sorted(files.items()):
+        relative = os.path.relpath(source, BUILD_DIR).replace(os.sep, "/")
+        lines.append(f'    <file alias="{escape(alias)}">{escape(relative)}</file>')
+    lines += ['</qresource>', '</RCC>', '']
+    with open(qrc_path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines))
+    return qrc_path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=f"Build {RESOURCE_FILE} from style.qss and sources/")
+    parser.add_argument("--rcc", help="path to Qt's rcc (or pyside6-rcc)")
+    parser.add_argument("-o", "--output", default=RESOURCE_FILE)
+    args = parser.parse_args(argv)
+
+    rcc = find_rcc(args.rcc)
+    if rcc is None:
+        parser.error("rcc not found, install Qt tools or PySide6, or pass --rcc")
+
+    app = QGuiApplication(sys.argv[:1])
+    files = {name: name for name in STATIC_FILES}
+    files.update(build_backgrounds())
+    qrc_path = write_qrc(files)
+
+    subprocess.run(rcc + ["--binary", "-o", os.path.abspath(args.output), qrc_path],
+                   check=True)
+    print(f"{args.output}: {len(files)} files, {os.path.getsize(args.output) / 1024:.0f} KiB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,363 @@
+import os
+import re
+import threading
+import numpy as np
+import weatherapi
+import theme
+import resources
+from forecaststats import ForecastMatrix, ForecastHistory, FIELDS
+from PyQt6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame, QLineEdit,
+    QPushButton, QComboBox
+)
+from PyQt6.QtGui import QFont, QPainter, QIcon, QColor, QBrush, QImage, QPen
+from PyQt6.QtCore import Qt, QPointF, QRectF, QSize, QStandardPaths, pyqtSignal
+from PyQt6.QtCharts import QChart, QChartView, QLineSeries, QAreaSeries, QCategoryAxis, QValueAxis
+
+MAX_OVERLAY = 8
+COLD = np.array([49, 130, 189], dtype=np.float64)
+MILD = np.array([247, 247, 247], dtype=np.float64)
+HOT = np.array([214, 96, 77], dtype=np.float64)
+OVERLAY_COLORS = ["#ffd166", "#06d6a0", "#ef476f", "#118ab2", "#f78c6b", "#83d483", "#c77dff", "#a0c4ff"]
+
+def history_path():
+    base = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.GenericDataLocation)
+    return os.path.join(base, "Weather4You", "history.npz")
+
+def colorize(data, symmetric=False):
+    with np.errstate(all="ignore"):
+        if symmetric:
+            bound = np.nanmax(np.abs(data)) if np.isfinite(data).any() else 0
+            low, high = -bound, bound
+        else:
+            low, high = (np.nanmin(data), np.nanmax(data)) if np.isfinite(data).any() else (0, 0)
+        t = (data - low) / (high - low) if high > low else np.full(data.shape, 0.5)
+    t = np.nan_to_num(t, nan=0.5)[..., None]
+    rgb = np.where(t < 0.5, COLD + (MILD - COLD) * (t * 2), MILD + (HOT - MILD) * (t * 2 - 1))
+
+    rows, columns = data.shape
+    rgba = np.empty((rows, columns, 4), dtype=np.uint8)
+    rgba[..., :3] = rgb.round()
+    rgba[..., 3] = np.where(np.isnan(data), 40, 255)
+    return QImage(rgba.tobytes(), columns, rows, columns * 4, QImage.Format.Format_RGBA8888).copy()
+
+class HeatmapWidget(QWidget):
+    def __init__(self):
+        super().__init__()
+        self.image = None
+        self.values = None
+        self.row_labels = []
+        self.column_labels = []
+        self.setMinimumHeight(160)
+
+    def set_data(self, values, row_labels, column_labels, symmetric=False):
+        self.values = values
+        self.image = colorize(values, symmetric)
+        self.row_labels = row_labels
+        self.column_labels = column_labels
+        self.update()
+
+    def paintEvent(self, event):
+        if self.image is None:
+            return
+        painter = QPainter(self)
+        painter.setFont(theme.font(10))
+        painter.setPen(QColor(255, 255, 255))
+
+        rows, columns = self.values.shape
+        left = 190 if self.height() / rows >= 14 else 10
+        area = QRectF(left, 24, self.width() - left - 10, self.height() - 34)
+        cell_width = area.width() / columns
+        cell_height = area.height() / rows
+
+        # Scaling the small image keeps painting cheap for hundreds of cities.
+        painter.drawImage(area, self.image)
+
+        for column, label in enumerate(self.column_labels):
+            painter.drawText(QRectF(area.left() + column * cell_width, 0, cell_width, 22),
+                             Qt.AlignmentFlag.AlignCenter, label)
+
+        if left > 10:
+            for row, label in enumerate(self.row_labels):
+                painter.drawText(QRectF(0, area.top() + row * cell_height, left - 8, cell_height),
+                                 Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter, label)
+
+        if cell_width >= 40 and cell_height >= 18:
+            painter.setPen(QColor(20, 20, 20))
+            for row in range(rows):
+                for column in range(columns):
+                    value = self.values[row, column]
+                    if np.isnan(value):
+                        continue
+                    painter.drawText(QRectF(area.left() + column * cell_width, area.top() + row * cell_height,
+                                            cell_width, cell_height),
+                                     Qt.AlignmentFlag.AlignCenter, f"{round(value)}")
+        painter.end()
+
+class CompareScreen(QWidget):
+    forecasts_loaded = pyqtSignal(list)
+
+    def __init__(self, stacked_widget, search_screen):
+        super().__init__()
+        self.stacked_widget = stacked_widget
+        self.search_screen = search_screen
+        self.current_language = "RU"
+        self.matrix = None
+        self.history_mean = None
+        self.history = ForecastHistory(history_path())
+
+        self.translations = {
+            "RU": {
+                "placeholder": "Города через запятую",
+                "compare": "Сравнить",
+                "loading": "Загрузка...",
+                "nothing": "Нет данных для этих городов",
+                "warmest": "Теплее всего:",
+                "spread": "Наибольший разброс между городами:",
+                "day_night": "Самый большой перепад день/ночь:",
+                "fields": {
+                    "temp_day": "Днём (°C)",
+                    "temp_night": "Ночью (°C)",
+                    "humidity": "Влажность (%)",
+                    "wind": "Ветер (м/с)",
+                    "anomaly": "Отклонение (°C)"
+                },
+                "mean": "Среднее",
+                "range": "Мин/макс"
+            },
+            "EN": {
+                "placeholder": "Cities separated by commas",
+                "compare": "Compare",
+                "loading": "Loading...",
+                "nothing": "No data for these cities",
+                "warmest": "Warmest:",
+                "spread": "Largest spread between cities:",
+                "day_night": "Largest day/night swing:",
+                "fields": {
+                    "temp_day": "Day (°C)",
+                    "temp_night": "Night (°C)",
+                    "humidity": "Humidity (%)",
+                    "wind": "Wind (m/s)",
+                    "anomaly": "Anomaly (°C)"
+                },
+                "mean": "Mean",
+                "range": "Min/max"
+            }
+        }
+
+        self.init_ui()
+        self.forecasts_loaded.connect(self.show_forecasts)
+        search_screen.language_changed.connect(self.change_language)
+        search_screen.forecast_data_ready.connect(self.remember_city)
+
+    def init_ui(self):
+        main_layout = QVBoxLayout(self)
+        main_layout.setSpacing(15)
+        main_layout.setContentsMargins(20, 20, 20, 20)
+
+        theme.set_window_palette(self)
+
+        top_row = QHBoxLayout()
+        top_row.setContentsMargins(0, 0, 0, 10)
+
+        self.back_button = QPushButton()
+        self.back_button.setIcon(QIcon(resources.path('sources/icons/home.png')))
+        self.back_button.setIconSize(QSize(30, 30))
+        self.back_button.clicked.connect(lambda: self.stacked_widget.setCurrentIndex(0))
+        top_row.addWidget(self.back_button)
+
+        self.cities_input = QLineEdit()
+        self.cities_input.returnPressed.connect(self.load)
+        top_row.addWidget(self.cities_input, stretch=1)
+
+        self.field_combo = QComboBox()
+        self.field_combo.setFixedHeight(40)
+        self.field_combo.currentIndexChanged.connect(self.update_views)
+        top_row.addWidget(self.field_combo)
+
+        self.compare_button = QPushButton()
+        self.compare_button.setObjectName("compareButton")
+        self.compare_button.clicked.connect(self.load)
+        top_row.addWidget(self.compare_button)
+
+        main_layout.addLayout(top_row)
+
+        self.summary_label = QLabel("")
+        self.summary_label.setFont(theme.font(12))
+        self.summary_label.setProperty("textRole", "secondary")
+        self.summary_label.setWordWrap(True)
+        main_layout.addWidget(self.summary_label)
+
+        heatmap_frame = QFrame()
+        heatmap_frame.setObjectName("chartFrame")
+        heatmap_layout = QVBoxLayout(heatmap_frame)
+        heatmap_layout.setContentsMargins(0, 0, 0, 0)
+        self.heatmap = HeatmapWidget()
+        heatmap_layout.addWidget(self.heatmap)
+        main_layout.addWidget(heatmap_frame, stretch=2)
+
+        chart_frame = QFrame()
+        chart_frame.setObjectName("chartFrame")
+        chart_layout = QVBoxLayout(chart_frame)
+        chart_layout.setContentsMargins(0, 0, 0, 0)
+        self.chart_view = QChartView()
+        self.chart_view.setRenderHint(QPainter.RenderHint.Antialiasing)
+        chart_layout.addWidget(self.chart_view)
+        main_layout.addWidget(chart_frame, stretch=2)
+
+        self.update_ui_texts()
+
+    def change_language(self, language):
+        self.current_language = language
+        self.update_ui_texts()
+
+    def update_ui_texts(self):
+        trans = self.translations[self.current_language]
+        self.cities_input.setPlaceholderText(trans["placeholder"])
+        self.compare_button.setText(trans["compare"])
+
+        index = max(self.field_combo.currentIndex(), 0)
+        self.field_combo.blockSignals(True)
+        self.field_combo.clear()
+        for key in FIELDS + ("anomaly",):
+            self.field_combo.addItem(trans["fields"][key], key)
+        self.field_combo.setCurrentIndex(index)
+        self.field_combo.blockSignals(False)
+        self.update_views()
+
+    def remember_city(self, forecast_data):
+        if not self.cities_input.text().strip():
+            self.cities_input.setText(forecast_data.city)
+
+    def load(self):
+        cities = [city.strip() for city in re.split(r"[,;\n]", self.cities_input.text()) if city.strip()]
+        if not cities:
+            return
+
+        trans = self.translations[self.current_language]
+        self.summary_label.setText(trans["loading"])
+        self.compare_button.setEnabled(False)
+        language = self.search_screen.current_language
+        threading.Thread(target=lambda: self.forecasts_loaded.emit(
+            [forecast for forecast in weatherapi.fetch_forecasts(cities, language) if forecast]),
+            daemon=True).start()
+
+    def show_forecasts(self, forecasts):
+        self.compare_button.setEnabled(True)
+        matrix = ForecastMatrix.from_forecasts(forecasts)
+        if not matrix.dates:
+            self.matrix = None
+            self.summary_label.setText(self.translations[self.current_language]["nothing"])
+            return
+
+        self.matrix = matrix
+        self.history_mean = self.history.mean(self.matrix.cities)
+        self.history.record(self.matrix)
+        self.history.save()
+        self.update_views()
+
+    def update_views(self):
+        if self.matrix is None:
+            return
+        trans = self.translations[self.current_language]
+        field = self.field_combo.currentData() or FIELDS[0]
+
+        if field == "anomaly":
+            values = self.matrix.anomalies(self.history_mean)
+        else:
+            values = self.matrix.field(field)
+        daily = self.matrix.daily_stats(values)
+        per_city = self.matrix.city_stats(values)
+
+        row_labels = []
+        for city, low, high in zip(self.matrix.cities, per_city["min"], per_city["max"]):
+            row_labels.append(city if np.isnan(low) else f"{city}  {round(low)}…{round(high)}")
+        self.heatmap.set_data(values, row_labels, self.matrix.dates, symmetric=field == "anomaly")
+
+        warmest = self.matrix.warmest_per_day()
+        days = ", ".join(f"{date}: {self.matrix.cities[row]}" for date, row in zip(self.matrix.dates, warmest))
+        lines = [f"{trans['warmest']} {days}"]
+        if np.isfinite(daily["spread"]).any():
+            day = np.nanargmax(daily["spread"])
+            lines.append(f"{trans['spread']} {daily['spread'][day]:.1f} ({self.matrix.dates[day]})")
+        swing = self.matrix.city_stats(self.matrix.day_night_range())["mean"]
+        if np.isfinite(swing).any():
+            row = np.nanargmax(swing)
+            lines.append(f"{trans['day_night']} {self.matrix.cities[row]} ({swing[row]:.1f}°C)")
+        self.summary_label.setText("\n".join(lines))
+
+        self.update_chart(values, trans["fields"][field], daily)
+
+    def update_chart(self, values, title, daily):
+        trans = self.translations[self.current_language]
+        chart = QChart()
+        chart.setTitle(title)
+        chart.setTitleFont(theme.font(12, QFont.Weight.Medium))
+        chart.setTitleBrush(QBrush(QColor(255, 255, 255)))
+        chart.legend().setLabelColor(QColor(255, 255, 255))
+        chart.setBackgroundBrush(QBrush(QColor(0, 0, 0, 0)))
+        chart.setPlotAreaBackgroundBrush(QBrush(QColor(0, 0, 0, 0)))
+        chart.setPlotAreaBackgroundVisible(True)
+
+        days = values.shape[1]
+        # Days without any value come out of the stats as NaN and are skipped.
+        low, high, mean = daily["min"], daily["max"], daily["mean"]
+
+        lower, upper = QLineSeries(), QLineSeries()
+        for i in range(days):
+            if not np.isnan(low[i]):
+                lower.append(QPointF(i, low[i]))
+                upper.append(QPointF(i, high[i]))
+        band = QAreaSeries(upper, lower)
+        # QAreaSeries does not own its boundary series.
+        upper.setParent(band)
+        lower.setParent(band)
+        band.setName(trans["range"])
+        band.setBrush(QBrush(QColor(255, 255, 255, 40)))
+        band.setPen(QPen(Qt.PenStyle.NoPen))
+        series_list = [band]
+
+        for row in range(min(len(self.matrix), MAX_OVERLAY)):
+            series = QLineSeries()
+            series.setName(self.matrix.cities[row])
+            series.setColor(QColor(OVERLAY_COLORS[row % len(OVERLAY_COLORS)]))
+            for i in range(days):
+                if not np.isnan(values[row, i]):
+                    series.append(QPointF(i, values[row, i]))
+            series_list.append(series)
+
+        mean_series = QLineSeries()
+        mean_series.setName(trans["mean"])
+        pen = QPen(QColor(255, 255, 255))
+        pen.setWidth(3)
+        pen.setStyle(Qt.PenStyle.DashLine)
+        mean_series.setPen(pen)
+        for i in range(days):
+            if not np.isnan(mean[i]):
+                mean_series.append(QPointF(i, mean[i]))
+        series_list.append(mean_series)
+
+        axisX = QCategoryAxis()
+        axisX.setLabelsPosition(QCategoryAxis.AxisLabelsPosition.AxisLabelsPositionOnValue)
+        for i, date in enumerate(self.matrix.dates):
+            axisX.append(date, i)
+        axisX.setRange(0, max(days - 1, 1))
+        axisX.setLabelsColor(QColor(255, 255, 255))
+        axisX.setGridLineColor(QColor(255, 255, 255, 30))
+
+        axisY = QValueAxis()
+        finite = values[np.isfinite(values)]
+        if finite.size:
+            axisY.setRange(float(finite.min()) - 2, float(finite.max()) + 2)
+        axisY.setTitleFont(theme.font(10))
+        axisY.setLabelsColor(QColor(255, 255, 255))
+        axisY.setGridLineColor(QColor(255, 255, 255, 30))
+
+        chart.addAxis(axisX, Qt.AlignmentFlag.AlignBottom)
+        chart.addAxis(axisY, Qt.AlignmentFlag.AlignLeft)
+        for series in series_list:
+            chart.addSeries(series)
+            series.attachAxis(axisX)
+            series.attachAxis(axisY)
+
+        self.chart_view.setChart(chart)
@@ -0,0 +1,128 @@
+import os
+import datetime
+import warnings
+import numpy as np
+
+FIELDS = ("temp_day", "temp_night", "humidity", "wind")
+DAYS = 7
+
+
+def summarize(data, axis):
+    # Rows or columns without any value come out as NaN; numpy warns about them.
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        low = np.nanmin(data, axis=axis)
+        high = np.nanmax(data, axis=axis)
+        mean = np.nanmean(data, axis=axis)
+    return {
+        "min": low,
+        "max": high,
+        "mean": mean,
+        "spread": high - low
+    }
+
+
+class ForecastMatrix:
+    def __init__(self, cities, values, dates=None):
+        # values has the shape (len(FIELDS), cities, days); missing days are NaN.
+        self.cities = list(cities)
+        self.values = np.asarray(values, dtype=np.float64)
+        self.dates = list(dates or [])
+
+    @classmethod
+    def from_forecasts(cls, forecasts):
+        # Columns follow the longest series so every column has a date and some data.
+        longest = max(forecasts, key=len, default=None)
+        columns = min(len(longest), DAYS) if longest is not None else 0
+        values = np.full((len(FIELDS), len(forecasts), columns), np.nan)
+        for row, forecast in enumerate(forecasts):
+            days = min(len(forecast), columns)
+            for i, field in enumerate(FIELDS):
+                # The series columns are array('d'), so this is a buffer copy.
+                values[i, row, :days] = np.frombuffer(getattr(forecast, field), dtype=np.float64)[:days]
+        dates = [longest.date(i) for i in range(columns)]
+        return cls([forecast.city for forecast in forecasts], values, dates)
+
+    def __len__(self):
+        return len(self.cities)
+
+    def field(self, name):
+        return self.values[FIELDS.index(name)]
+
+    def daily_stats(self, data="temp_day"):
+        # data is a field name or a derived (cities, days) array such as anomalies().
+        return summarize(self.field(data) if isinstance(data, str) else data, axis=0)
+
+    def city_stats(self, data="temp_day"):
+        return summarize(self.field(data) if isinstance(data, str) else data, axis=1)
+
+    def day_night_range(self):
+        return self.field("temp_day") - self.field("temp_night")
+
+    def warmest_per_day(self):
+        data = np.where(np.isnan(self.field("temp_day")), -np.inf, self.field("temp_day"))
+        return data.argmax(axis=0)
+
+    def anomalies(self, history_mean):
+        temps = self.field("temp_day")
+        history_mean = np.asarray(history_mean, dtype=np.float64)
+        # Cities without history are compared against their own week instead.
+        baseline = np.where(np.isnan(history_mean), np.nanmean(temps, axis=1), history_mean)
+        return temps - baseline[:, None]
+
+
+class ForecastHistory:
+    def __init__(self, path):
+        self.path = path
+        self.index = {}
+        self.sums = np.zeros(0)
+        self.counts = np.zeros(0, dtype=np.int64)
+        self.last_day = np.zeros(0, dtype=np.int64)
+        self.load()
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with np.load(self.path, allow_pickle=False) as data:
+                cities = list(data["cities"])
+                sums, counts, last_day = data["sums"], data["counts"], data["last_day"]
+        except (OSError, ValueError, KeyError):
+            return
+        self.index = {str(city): i for i, city in enumerate(cities)}
+        self.sums, self.counts, self.last_day = sums, counts, last_day
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        cities = sorted(self.index, key=self.index.get)
+        np.savez(self.path, cities=np.array(cities, dtype=str), sums=self.sums,
+                 counts=self.counts, last_day=self.last_day)
+
+    def rows(self, cities):
+        new = [city.lower() for city in cities if city.lower() not in self.index]
+        for city in dict.fromkeys(new):
+            self.index[city] = len(self.index)
+        if new:
+            grow = len(self.index) - len(self.sums)
+            self.sums = np.concatenate([self.sums, np.zeros(grow)])
+            self.counts = np.concatenate([self.counts, np.zeros(grow, dtype=np.int64)])
+            self.last_day = np.concatenate([self.last_day, np.zeros(grow, dtype=np.int64)])
+        return np.array([self.index[city.lower()] for city in cities], dtype=np.int64)
+
+    def record(self, matrix, today=None):
+        today = (today or datetime.date.today()).toordinal()
+        if not matrix.dates:
+            return
+        rows = self.rows(matrix.cities)
+        temps = matrix.field("temp_day")[:, 0]
+        # Only the first observation of a city on a given day counts.
+        fresh = (self.last_day[rows] != today) & ~np.isnan(temps)
+        np.add.at(self.sums, rows[fresh], temps[fresh])
+        np.add.at(self.counts, rows[fresh], 1)
+        self.last_day[rows[fresh]] = today
+
+    def mean(self, cities):
+        rows = self.rows(cities)
+        counts = self.counts[rows]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(counts > 0, self.sums[rows] / counts, np.nan)
@@ -0,0 +1,80 @@
+import json
+import getpass
+from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtNetwork import QLocalServer, QLocalSocket
+
+def server_name():
+    try:
+        user = getpass.getuser()
+    except Exception:
+        user = "user"
+    return f"Weather4You-{user}"
+
+class SingleInstance(QObject):
+    message_received = pyqtSignal(list)
+
+    def __init__(self, name=None):
+        super().__init__()
+        self.name = name or server_name()
+        self.server = None
+        self.buffers = {}
+
+    def is_running(self, timeout=500):
+        socket = QLocalSocket()
+        socket.connectToServer(self.name)
+        if not socket.waitForConnected(timeout):
+            return False
+        socket.disconnectFromServer()
+        return True
+
+    def send(self, arguments, timeout=500):
+        socket = QLocalSocket()
+        socket.connectToServer(self.name)
+        if not socket.waitForConnected(timeout):
+            return False
+
+        socket.write(json.dumps(arguments).encode("utf-8") + b"\n")
+        socket.flush()
+        socket.waitForBytesWritten(timeout)
+        socket.disconnectFromServer()
+        return True
+
+    def listen(self):
+        # Another instance may have started since send() failed. With socket
+        # options set, Qt's listen() replaces an existing socket instead of
+        # failing, so this has to be checked first.
+        if self.is_running():
+            return False
+        self.server = QLocalServer(self)
+        self.server.setSocketOptions(QLocalServer.SocketOption.UserAccessOption)
+        if not self.server.listen(self.name):
+            # Nobody answered, so the socket was left behind by a crashed instance.
+            QLocalServer.removeServer(self.name)
+            if not self.server.listen(self.name):
+                return False
+        self.server.newConnection.connect(self.on_new_connection)
+        return True
+
+    def on_new_connection(self):
+        while (socket := self.server.nextPendingConnection()) is not None:
+            self.buffers[socket] = b""
+            socket.readyRead.connect(lambda s=socket: self.on_ready_read(s))
+            socket.disconnected.connect(lambda s=socket: self.on_disconnected(s))
+
+    def on_ready_read(self, socket):
+        self.buffers[socket] += bytes(socket.readAll())
+        if not self.buffers[socket].endswith(b"\n"):
+            return
+
+        data = self.buffers[socket]
+        self.buffers[socket] = b""
+        try:
+            arguments = json.loads(data.decode("utf-8"))
+        except ValueError:
+            return
+        if isinstance(arguments, list):
+            self.message_received.emit([str(arg) for arg in arguments])
+
+    def on_disconnected(self, socket):
+        self.buffers.pop(socket, None)
+        socket.deleteLater()
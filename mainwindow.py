@@ -0,0 +1,85 @@
+from searchscreen import SearchScreen
+from weatherscreen import ShowWeather
+from comparescreen import CompareScreen
+from tray import TrayIcon
+from alerts import AlertWatcher
+import threading
+import weatherapi
+import theme
+from PyQt6.QtWidgets import (QApplication, QStackedWidget)
+from PyQt6.QtCore import QTimer
+
+PREFETCH_INTERVAL = 60
+
+class WeatherApp(QStackedWidget):
+    def __init__(self, resident=False):
+        super().__init__()
+        theme.apply()
+        self.setWindowTitle('Weather4You')
+        self.setGeometry(100, 100, 1200, 740)
+        self.center()
+        self.search_screen = SearchScreen(self)
+        self.addWidget(self.search_screen)
+        self.weatherscreen = ShowWeather(self,self.search_screen)
+        self.addWidget(self.weatherscreen)
+        self.comparescreen = CompareScreen(self, self.search_screen)
+        self.addWidget(self.comparescreen)
+        self.setCurrentIndex(0)
+
+        self.tray = None
+        self.alert_watcher = None
+        if resident:
+            self.tray = TrayIcon(self)
+            self.tray.show()
+            self.alert_watcher = AlertWatcher(self.search_screen.current_language)
+            self.alert_watcher.alert_raised.connect(self.tray.show_alert)
+            self.search_screen.language_changed.connect(self.alert_watcher.set_language)
+            self.alert_watcher.start()
+            self.prefetch_timer = QTimer(self)
+            self.prefetch_timer.timeout.connect(self.prefetch_favourites)
+            self.prefetch_timer.start(PREFETCH_INTERVAL * 1000)
+            self.prefetch_favourites()
+
+    def center(self):
+        screen = QApplication.primaryScreen()  
+        screen_geometry = screen.availableGeometry()  
+        window_geometry = self.frameGeometry() 
+        center_point = screen_geometry.center()
+        window_geometry.moveCenter(center_point)
+        self.move(window_geometry.topLeft())
+
+    def prefetch_favourites(self):
+        cities = self.search_screen.favourite_cities()
+        if self.alert_watcher is not None:
+            self.alert_watcher.set_locations(cities)
+        if cities:
+            # Only entries that would expire before the next tick are fetched again.
+            threading.Thread(target=weatherapi.fetch_many,
+                             args=(cities, self.search_screen.current_language),
+                             kwargs={"max_age": weatherapi.CACHE_TTL - PREFETCH_INTERVAL},
+                             daemon=True).start()
+
+    def show_window(self):
+        self.showNormal()
+        self.raise_()
+        self.activateWindow()
+
+    def handle_arguments(self, arguments):
+        self.show_window()
+        city = " ".join(arguments).strip()
+        if city:
+            self.search_screen.location_input.setText(city)
+            self.search_screen.search_timer.stop()
+            self.search_screen.on_city_entered()
+
+    def closeEvent(self, event):
+        if self.tray is not None:
+            self.hide()
+            event.ignore()
+        else:
+            super().closeEvent(event)
+
+    def quit(self):
+        if self.alert_watcher is not None:
+            self.alert_watcher.stop()
+        QApplication.quit()
@@ -0,0 +1,173 @@
+import sys
+import datetime
+from array import array
+
+DAYS = 7
+
+
+class CurrentConditions:
+    __slots__ = ("city", "temp", "feels_like", "humidity", "pressure", "wind", "description", "icon")
+
+    def __init__(self, city, temp, feels_like, humidity, pressure, wind, description, icon):
+        self.city = city
+        self.temp = temp
+        self.feels_like = feels_like
+        self.humidity = humidity
+        self.pressure = pressure
+        self.wind = wind
+        self.description = description
+        self.icon = icon
+
+    @classmethod
+    def from_weather(cls, data):
+        main = data["main"]
+        weather = data["weather"][0]
+        return cls(data["name"], main["temp"], main["feels_like"], main["humidity"],
+                   main["pressure"], data["wind"]["speed"], weather["description"], weather["icon"])
+
+    @classmethod
+    def from_onecall(cls, city, current):
+        weather = current["weather"][0]
+        return cls(city, current["temp"], current["feels_like"], current["humidity"],
+                   current.get("pressure"), current["wind_speed"], weather["description"], weather["icon"])
+
+    def __repr__(self):
+        return f"CurrentConditions({self.city!r}, {self.temp}°C, {self.description!r})"
+
+
+class ForecastDay:
+    # A view into one row of a ForecastSeries, nothing is copied.
+    __slots__ = ("series", "index")
+
+    def __init__(self, series, index):
+        self.series = series
+        self.index = index
+
+    @property
+    def dt(self):
+        return self.series.dt[self.index]
+
+    @property
+    def temp_day(self):
+        return self.series.temp_day[self.index]
+
+    @property
+    def temp_night(self):
+        return self.series.temp_night[self.index]
+
+    @property
+    def humidity(self):
+        return self.series.humidity[self.index]
+
+    @property
+    def wind(self):
+        return self.series.wind[self.index]
+
+    @property
+    def description(self):
+        return self.series.descriptions[self.index]
+
+    @property
+    def icon(self):
+        return self.series.icons[self.index]
+
+    @property
+    def date(self):
+        return self.series.date(self.index)
+
+    @property
+    def day_name(self):
+        return self.series.day_name(self.index)
+
+
+class ForecastSeries:
+    __slots__ = ("city", "current", "dt", "temp_day", "temp_night", "humidity", "wind",
+                 "descriptions", "icons")
+
+    def __init__(self, city, current=None):
+        self.city = city
+        self.current = current
+        self.dt = array("q")
+        self.temp_day = array("d")
+        self.temp_night = array("d")
+        self.humidity = array("d")
+        self.wind = array("d")
+        self.descriptions = []
+        self.icons = []
+
+    @classmethod
+    def from_onecall(cls, city, data, days=DAYS):
+        series = cls(city, CurrentConditions.from_onecall(city, data["current"]))
+        for day in data["daily"][:days]:
+            series.append(day)
+        return series
+
+    def append(self, day):
+        weather = day["weather"][0]
+        self.dt.append(day["dt"])
+        self.temp_day.append(day["temp"]["day"])
+        self.temp_night.append(day["temp"]["night"])
+        self.humidity.append(day["humidity"])
+        self.wind.append(day["wind_speed"])
+        # Descriptions and icons repeat across days and cities, keep one copy of each.
+        self.descriptions.append(sys.intern(weather["description"]))
+        self.icons.append(sys.intern(weather["icon"]))
+
+    def __len__(self):
+        return len(self.dt)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [ForecastDay(self, i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("forecast day out of range")
+        return ForecastDay(self, index)
+
+    def __iter__(self):
+        return (ForecastDay(self, i) for i in range(len(self)))
+
+    def date(self, index):
+        return datetime.datetime.fromtimestamp(self.dt[index]).strftime("%d.%m")
+
+    def day_name(self, index):
+        return datetime.datetime.fromtimestamp(self.dt[index]).strftime("%A")
+
+    def __repr__(self):
+        return f"ForecastSeries({self.city!r}, {len(self)} days)"
+
+
+class Alert:
+    __slots__ = ("sender", "event", "start", "end", "description", "tags")
+
+    def __init__(self, sender, event, start, end, description, tags=()):
+        self.sender = sender
+        self.event = event
+        self.start = start
+        self.end = end
+        self.description = description
+        self.tags = tuple(tags)
+
+    @classmethod
+    def from_onecall(cls, alert):
+        return cls(alert.get("sender_name", ""), alert.get("event", ""), alert.get("start", 0),
+                   alert.get("end", 0), alert.get("description", ""), alert.get("tags", ()))
+
+    @property
+    def alert_id(self):
+        # One Call alerts carry no id; the issuer, event and start identify one.
+        return f"{self.sender}|{self.event}|{self.start}"
+
+    @property
+    def revision(self):
+        # Only the validity window counts; the text changes with the language.
+        return self.end
+
+    def period(self):
+        start = datetime.datetime.fromtimestamp(self.start).strftime("%d.%m %H:%M")
+        end = datetime.datetime.fromtimestamp(self.end).strftime("%d.%m %H:%M")
+        return f"{start} – {end}"
+
+    def __repr__(self):
+        return f"Alert({self.event!r}, {self.period()})"
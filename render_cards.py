@@ -0,0 +1,118 @@
+import os
+import re
+import sys
+import time
+import argparse
+import multiprocessing
+import weatherapi
+
+_app = None
+_window = None
+
+
+def _init_worker(language):
+    # Must be set before the QApplication of this process is created. A desktop
+    # session's own QT_QPA_PLATFORM would open real windows, so it is overridden.
+    os.environ["QT_QPA_PLATFORM"] = "offscreen"
+
+    from PyQt6.QtWidgets import QApplication
+    from mainwindow import WeatherApp
+
+    global _app, _window
+    _app = QApplication([])
+    _window = WeatherApp()
+    _window.search_screen.language_combo.setCurrentText(language)
+    _window.setCurrentIndex(1)
+    _window.show()
+
+
+def card_filename(city, taken):
+    # Different spellings can collapse to one name ("Kazan, RU", "Kazan RU"); number
+    # the later ones. Names are compared case-insensitively for Windows and macOS.
+    stem = re.sub(r"[^\w-]+", "_", city).strip("_") or "city"
+    name, number = stem + ".png", 1
+    while name.lower() in taken:
+        number += 1
+        name = f"{stem}_{number}.png"
+    taken.add(name.lower())
+    return name
+
+
+def render_card(job):
+    city, weather, forecast, path = job
+    search_screen = _window.search_screen
+    search_screen.weather_data_ready.emit(weather)
+    search_screen.forecast_data_ready.emit(forecast)
+    _app.processEvents()
+
+    if not _window.grab().save(path, "PNG"):
+        return city, None
+    return city, path
+
+
+def read_cities(args):
+    cities = list(args.cities)
+    if args.file:
+        with open(args.file, "r", encoding="utf-8") as f:
+            cities.extend(line.strip() for line in f if line.strip())
+    return cities
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render Weather4You cards to PNG without a display")
+    parser.add_argument("cities", nargs="*", help="city names")
+    parser.add_argument("-f", "--file", help="file with one city per line")
+    parser.add_argument("-o", "--output", default="cards", help="output directory")
+    parser.add_argument("-l", "--lang", default="RU", choices=["RU", "EN"])
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1,
+                        help="number of render processes")
+    parser.add_argument("--fetch-workers", type=int, default=8,
+                        help="number of concurrent API requests")
+    args = parser.parse_args(argv)
+
+    cities = read_cities(args)
+    if not cities:
+        parser.error("no cities given")
+    if not weatherapi.api_key_from_conf:
+        parser.error("api.txt does not contain an OpenWeatherMap API key")
+
+    os.makedirs(args.output, exist_ok=True)
+
+    started = time.perf_counter()
+    fetched = weatherapi.fetch_many(cities, args.lang, workers=args.fetch_workers)
+    fetch_time = time.perf_counter() - started
+
+    jobs = []
+    taken = set()
+    for city, weather, forecast in fetched:
+        if weather and forecast:
+            path = os.path.join(args.output, card_filename(city, taken))
+            jobs.append((city, weather, forecast, path))
+        else:
+            print(f"skipped {city}: no weather data", file=sys.stderr)
+
+    render_started = time.perf_counter()
+    rendered = 0
+    if jobs:
+        context = multiprocessing.get_context("spawn")
+        workers = max(1, min(args.workers, len(jobs)))
+        with context.Pool(workers, initializer=_init_worker, initargs=(args.lang,)) as pool:
+            for city, path in pool.imap_unordered(render_card, jobs):
+                if path:
+                    rendered += 1
+                    print(path)
+                else:
+                    print(f"failed to save {city}", file=sys.stderr)
+    render_time = time.perf_counter() - render_started
+    total_time = time.perf_counter() - started
+
+    print(f"fetched {len(fetched)} cities in {fetch_time:.2f}s", file=sys.stderr)
+    if rendered:
+        print(f"rendered {rendered} cards in {render_time:.2f}s "
+              f"({rendered / render_time:.1f} cards/s, {rendered / total_time:.1f} cards/s overall)",
+              file=sys.stderr)
+    return 0 if rendered == len(fetched) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+import sys
+import os
+import re
+from functools import lru_cache
+from PyQt6.QtCore import QObject, QResource, QFile, QIODevice, QDir, QThreadPool, pyqtSignal
+from PyQt6.QtGui import QImage
+
+@staticmethod
+def resource_path(relative):
+    if hasattr(sys, "_MEIPASS"):
+        return os.path.join(sys._MEIPASS, relative)
+    return os.path.join(relative)
+
+RESOURCE_FILE = "resources.rcc"
+BACKGROUNDS_DIR = "sources/backgrounds"
+BACKGROUND_WIDTHS = (960, 1280, 1920)
+MAX_CACHED_BACKGROUNDS = 3
+
+
+@lru_cache(maxsize=None)
+def register():
+    bundle = resource_path(RESOURCE_FILE)
+    return os.path.exists(bundle) and QResource.registerResource(bundle)
+
+
+def path(relative):
+    if register():
+        bundled = ":/" + relative.replace(os.sep, "/")
+        if QFile.exists(bundled):
+            return bundled
+    return resource_path(relative)
+
+
+def read_text(relative):
+    file = QFile(path(relative))
+    if not file.open(QIODevice.OpenModeFlag.ReadOnly | QIODevice.OpenModeFlag.Text):
+        raise OSError(f"cannot open {relative}")
+    try:
+        return bytes(file.readAll()).decode("utf-8")
+    finally:
+        file.close()
+
+
+@lru_cache(maxsize=None)
+def background_variants(name):
+    variants = []
+    if register():
+        pattern = re.compile(rf"{re.escape(name)}_(\d+)\.jpg$")
+        for entry in QDir(f":/{BACKGROUNDS_DIR}").entryList([f"{name}_*.jpg"]):
+            if match := pattern.match(entry):
+                variants.append((int(match.group(1)), f":/{BACKGROUNDS_DIR}/{entry}"))
+    if not variants:
+        variants.append((0, resource_path(os.path.join(BACKGROUNDS_DIR, f"{name}.jpg"))))
+    return sorted(variants)
+
+
+def background_path(name, width):
+    variants = background_variants(name)
+    for variant_width, variant_path in variants:
+        if variant_width >= width:
+            return variant_path
+    return variants[-1][1]
+
+
+class BackgroundLoader(QObject):
+    ready = pyqtSignal(str)
+    decoded = pyqtSignal(str, QImage)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.images = {}
+        self.pending = set()
+        self.decoded.connect(self.store)
+
+    def image(self, image_path):
+        return self.images.get(image_path)
+
+    def request(self, image_path):
+        if image_path in self.images or image_path in self.pending:
+            return
+        self.pending.add(image_path)
+        # QImage, unlike QPixmap, may be decoded outside the GUI thread.
+        QThreadPool.globalInstance().start(lambda: self.decoded.emit(image_path, QImage(image_path)))
+
+    def store(self, image_path, image):
+        self.pending.discard(image_path)
+        if image.isNull():
+            return
+        self.images[image_path] = image
+        while len(self.images) > MAX_CACHED_BACKGROUNDS:
+            self.images.pop(next(iter(self.images)))
+        self.ready.emit(image_path)
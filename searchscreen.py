@@ -1,40 +1,31 @@
-import sys
-import os
 import requests
 import datetime
+import weatherapi
+import resources
+from weatherapi import api_key_from_conf
 from geopy.geocoders import Nominatim
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QLineEdit, QPushButton,
     QHBoxLayout, QGraphicsBlurEffect, QMessageBox, QComboBox, 
-    QCompleter
+    QCompleter, QApplication
 )
-from PyQt6.QtGui import (QFontDatabase, QPixmap, QIcon)
-from PyQt6.QtCore import Qt, QSize, pyqtSignal, QTimer, QStringListModel
-
-@staticmethod
-def resource_path(relative):
-    if hasattr(sys, "_MEIPASS"):
-        return os.path.join(sys._MEIPASS, relative)
-    return os.path.join(relative)
-
-api_key_path = resource_path("api.txt")
-try:
-    with open(api_key_path, "r") as f:
-        api_key_from_conf = f.read().strip()
-except Exception:
-    api_key_from_conf = ""
+from PyQt6.QtGui import (QPixmap, QIcon)
+from PyQt6.QtCore import Qt, QSize, pyqtSignal, QTimer, QStringListModel, QSettings
 
 USERNAME_GEONAMES = 'r3dbad'
+MAX_FAVOURITES = 5
+SLOT_HOURS = [6, 12, 18, 22]
 
 class SearchScreen(QWidget):
     language_changed = pyqtSignal(str)
-    weather_data_ready = pyqtSignal(dict) 
-    forecast_data_ready = pyqtSignal(dict)  
+    weather_data_ready = pyqtSignal(object) 
+    forecast_data_ready = pyqtSignal(object)  
     
     def __init__(self, stacked_widget):
         super().__init__()
         self.stacked_widget = stacked_widget
         self.current_language = "RU"  
+        self.settings = QSettings("Weather4You", "Weather4You")
         self.translations = {
             "RU": {
                 "greeting_morning": "Доброе утро!",
@@ -73,14 +64,12 @@ class SearchScreen(QWidget):
         container_widget = QWidget(self)
         layout = QVBoxLayout(container_widget)
 
-        font_path = resource_path(os.path.join('sources/fonts/', 'try-clother.ttf'))
-        font_id = QFontDatabase.addApplicationFont(font_path)
-        font_family = QFontDatabase.applicationFontFamilies(font_id)[0] if font_id != -1 else "Arial"
+        self.background_loader = resources.BackgroundLoader(self)
+        self.background_loader.ready.connect(self.on_background_ready)
 
         self.image_path, greeting = self.set_bg()
         self.background_label = QLabel(self)
-        pixmap = QPixmap(self.image_path)
-        self.background_label.setPixmap(pixmap)
+        self.show_background()
         self.background_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.background_label.setScaledContents(True)
         self.blur_effect = QGraphicsBlurEffect(self)
@@ -89,13 +78,7 @@ class SearchScreen(QWidget):
 
         self.title_label = QLabel(greeting, self)
         self.title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.title_label.setStyleSheet(f"""
-            font-size: 72px;
-            color: Aqua;
-            font-family: {font_family};
-            font-weight: bold;
-            background: transparent;
-        """)
+        self.title_label.setObjectName("titleLabel")
         self.title_label.setMinimumHeight(200)
 
         layout.addWidget(self.title_label, alignment=Qt.AlignmentFlag.AlignCenter)
@@ -115,11 +98,11 @@ class SearchScreen(QWidget):
         self.setLayout(layout)
 
         self.location_button = QPushButton(self)
-        location_icon_path = resource_path(os.path.join('sources/icons/', 'location.png'))
+        location_icon_path = resources.path('sources/icons/location.png')
         self.location_button.setIcon(QIcon(location_icon_path))
         self.location_button.setIconSize(QSize(50, 50)) 
         self.location_button.setFixedSize(60, 60) 
-        self.location_button.setStyleSheet("border: none; background: transparent;")
+        self.location_button.setObjectName("locationButton")
         self.location_button.clicked.connect(self.set_location_from_ip)
         self.location_button.setParent(self)  
         self.location_button.show()
@@ -142,6 +125,11 @@ class SearchScreen(QWidget):
         self.location_input.textChanged.connect(self.on_text_edited)
         self.location_input.returnPressed.connect(self.on_city_entered)
 
+        self.slot_timer = QTimer(self)
+        self.slot_timer.setSingleShot(True)
+        self.slot_timer.timeout.connect(self.update_time_slot)
+        self.schedule_time_slot()
+
     def setup_completer(self):
         self.completer = QCompleter()
         self.completer.setModel(self.completer_model)
@@ -149,21 +137,7 @@ class SearchScreen(QWidget):
         self.completer.setFilterMode(Qt.MatchFlag.MatchContains)
         self.completer.setCompletionMode(QCompleter.CompletionMode.PopupCompletion)
         self.completer.setMaxVisibleItems(8)
-        self.completer.popup().setStyleSheet("""
-                QListView {
-                    background: rgba(40, 40, 40, 0.95);
-                    color: white;
-                    border: 1px solid #555;
-                    font-size: 16px;
-                    padding: 4px;
-                }
-                QListView::item {
-                    padding: 6px;
-                    border-bottom: 1px solid #333;
-                }
-                    QListView::item:hover {
-                    background: #555;
-                }""")
+        self.completer.popup().setObjectName("completerPopup")
         
         self.location_input.setCompleter(self.completer)
 
@@ -249,8 +223,8 @@ class SearchScreen(QWidget):
         lang = self.current_language
         self.location_input.setPlaceholderText(self.translations[lang]["placeholder"])
 
-    def set_bg(self):
-        now = datetime.datetime.now()
+    def set_bg(self, now=None):
+        now = now or datetime.datetime.now()
         month = now.month
         hour = now.hour
 
@@ -279,8 +253,43 @@ class SearchScreen(QWidget):
             time_day = 'evening'
             greeting = translations["greeting_night"]
 
-        bg_image =  resource_path(os.path.join('sources/backgrounds/', f'{season}_{time_day}.jpg'))
+        bg_image = resources.background_path(f'{season}_{time_day}', self.background_width())
         return bg_image, greeting
+
+    def background_width(self):
+        screen = QApplication.primaryScreen()
+        return round(screen.size().width() * screen.devicePixelRatio())
+
+    def next_slot_start(self, now):
+        for hour in SLOT_HOURS:
+            if now.hour < hour:
+                return now.replace(hour=hour, minute=0, second=0, microsecond=0)
+        tomorrow = now + datetime.timedelta(days=1)
+        return tomorrow.replace(hour=SLOT_HOURS[0], minute=0, second=0, microsecond=0)
+
+    def schedule_time_slot(self):
+        now = datetime.datetime.now()
+        next_slot = self.next_slot_start(now)
+        next_image, _ = self.set_bg(next_slot)
+        self.background_loader.request(next_image)
+        self.slot_timer.start(int((next_slot - now).total_seconds() * 1000) + 1000)
+
+    def update_time_slot(self):
+        self.image_path, greeting = self.set_bg()
+        self.title_label.setText(greeting)
+        self.show_background()
+        self.schedule_time_slot()
+
+    def show_background(self):
+        image = self.background_loader.image(self.image_path)
+        if image is None:
+            self.background_loader.request(self.image_path)
+            return
+        self.background_label.setPixmap(QPixmap.fromImage(image))
+
+    def on_background_ready(self, image_path):
+        if image_path == self.image_path:
+            self.show_background()
     
     def get_current_location(self):
         try:
@@ -335,6 +344,7 @@ class SearchScreen(QWidget):
             forecast = self.fetch_week_weather(city)
             
             if weather and forecast:
+                self.remember_city(city)
                 self.stacked_widget.setCurrentIndex(1)
             else:
                 self.show_error("error_city_not_found")
@@ -345,82 +355,29 @@ class SearchScreen(QWidget):
             self.show_error("api_error")
 
 
+    def favourite_cities(self):
+        cities = self.settings.value("favourites", [])
+        if isinstance(cities, str):
+            cities = [cities]
+        return list(cities or [])
+
+    def remember_city(self, city):
+        cities = [c for c in self.favourite_cities() if c.lower() != city.lower()]
+        cities.insert(0, city)
+        self.settings.setValue("favourites", cities[:MAX_FAVOURITES])
+
     def fetch_weather(self, city):
         if not api_key_from_conf:
             self.show_error("api_error")
             return None
 
-        try:
-            url = f"https://api.openweathermap.org/data/2.5/weather?q={city}&appid={api_key_from_conf}&units=metric&lang={'ru' if self.current_language == 'RU' else 'en'}"
-            response = requests.get(url, timeout=10)
-            data = response.json()
-            
-            if data.get("cod") != 200:
-                return None
-                
-            weather_data = {
-                "city": data["name"],
-                "temp": data["main"]["temp"],
-                "feels_like": data["main"]["feels_like"],
-                "humidity": data["main"]["humidity"],
-                "pressure": data["main"]["pressure"],
-                "wind": data["wind"]["speed"],
-                "description": data["weather"][0]["description"],
-                "icon": data["weather"][0]["icon"]
-            }
-            
+        weather_data = weatherapi.fetch_weather(city, self.current_language)
+        if weather_data:
             self.weather_data_ready.emit(weather_data)
-            return weather_data
-            
-        except Exception:
-            return None
+        return weather_data
 
     def fetch_week_weather(self, city):
-        if not api_key_from_conf:
-            return None
-
-        try:
-            geo_url = f"http://api.openweathermap.org/geo/1.0/direct?q={city}&limit=1&appid={api_key_from_conf}"
-            geo_response = requests.get(geo_url, timeout=10)
-            geo_data = geo_response.json()
-
-            if not geo_data:
-                return None
-                
-            lat, lon = geo_data[0]["lat"], geo_data[0]["lon"]
-            
-            url = f"https://api.openweathermap.org/data/3.0/onecall?lat={lat}&lon={lon}&units=metric&exclude=hourly,minutely&appid={api_key_from_conf}&lang={'ru' if self.current_language == 'RU' else 'en'}"
-            response = requests.get(url, timeout=10)
-            data = response.json()
-            
-            forecast_data = {
-                "city": city,
-                "current": {
-                    "temp": data["current"]["temp"],
-                    "feels_like": data["current"]["feels_like"],
-                    "humidity": data["current"]["humidity"],
-                    "wind": data["current"]["wind_speed"],
-                    "description": data["current"]["weather"][0]["description"],
-                    "icon": data["current"]["weather"][0]["icon"]
-                },
-                "daily": []
-            }
-            
-            for day in data["daily"][:7]:
-                day_data = {
-                    "date": datetime.datetime.fromtimestamp(day["dt"]).strftime("%d.%m"),
-                    "day_name": datetime.datetime.fromtimestamp(day["dt"]).strftime("%A"),
-                    "temp_day": day["temp"]["day"],
-                    "temp_night": day["temp"]["night"],
-                    "description": day["weather"][0]["description"],
-                    "icon": day["weather"][0]["icon"],
-                    "humidity": day["humidity"],
-                    "wind": day["wind_speed"]
-                }
-                forecast_data["daily"].append(day_data)
-            
+        forecast_data = weatherapi.fetch_week_weather(city, self.current_language)
+        if forecast_data:
             self.forecast_data_ready.emit(forecast_data)
-            return forecast_data
-            
-        except Exception:
-            return None
\ No newline at end of file
+        return forecast_data
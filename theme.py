@@ -0,0 +1,194 @@
+import resources
+from functools import lru_cache
+from string import Template
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtGui import QFont, QFontDatabase, QColor, QLinearGradient, QBrush, QPalette
+
+FONT_FAMILY = "Arial"
+
+THEMES = {
+    "default": {
+        "text": "white",
+        "text_secondary": "rgba(255, 255, 255, 0.9)",
+        "text_muted": "rgba(255, 255, 255, 0.7)",
+        "text_date": "rgba(255, 255, 255, 0.8)",
+        "title": "Aqua",
+        "card": "rgba(255, 255, 255, 0.1)",
+        "card_hover": "rgba(255, 255, 255, 0.05)",
+        "separator": "rgba(255, 255, 255, 0.3)",
+        "popup": "rgba(40, 40, 40, 0.95)",
+        "popup_border": "#555",
+        "popup_item_border": "#333",
+        "popup_hover": "#555",
+        "gradient_top": (30, 80, 150),
+        "gradient_bottom": (15, 40, 75)
+    }
+}
+
+# Rules for the widgets that used to carry their own inline stylesheets.
+# Every frame rule also covers the QFrame subclasses inside it (labels,
+# the chart view) because an inline "QFrame { ... }" sheet did the same.
+WIDGETS_QSS = Template("""
+QLabel[textRole="primary"] {
+    color: $text;
+}
+
+QLabel[textRole="secondary"] {
+    color: $text_secondary;
+}
+
+QLabel[textRole="muted"] {
+    color: $text_muted;
+}
+
+QLabel#dateLabel {
+    color: $text_date;
+}
+
+QLabel#titleLabel {
+    font-size: 72px;
+    color: $title;
+    font-family: $title_font;
+    font-weight: bold;
+    background: transparent;
+}
+
+QPushButton#locationButton,
+QPushButton#locationButton:hover,
+QPushButton#locationButton:pressed {
+    border: none;
+    background: transparent;
+}
+
+QPushButton#compareButton {
+    color: $text;
+    font-size: 16px;
+}
+
+QListView#completerPopup {
+    background: $popup;
+    color: $text;
+    border: 1px solid $popup_border;
+    font-size: 16px;
+    padding: 4px;
+}
+
+QListView#completerPopup::item {
+    padding: 6px;
+    border-bottom: 1px solid $popup_item_border;
+}
+
+QListView#completerPopup::item:hover {
+    background: $popup_hover;
+}
+
+QFrame#currentWeatherFrame,
+QFrame#currentWeatherFrame QFrame {
+    background: $card;
+    border-radius: 15px;
+    padding: 10px;
+}
+
+QFrame#currentWeatherFrame QFrame#separator {
+    color: $separator;
+}
+
+QFrame#weeklyFrame,
+QFrame#weeklyFrame QFrame {
+    background: $card;
+    border-radius: 15px;
+    padding: 6px;
+}
+
+QFrame#weeklyFrame QFrame#dayCard,
+QFrame#weeklyFrame QFrame#dayCard QFrame {
+    background: transparent;
+}
+
+QFrame#weeklyFrame QFrame#dayCard:hover,
+QFrame#weeklyFrame QFrame#dayCard QFrame:hover {
+    background: $card_hover;
+    border-radius: 10px;
+}
+
+QFrame#chartFrame,
+QFrame#chartFrame QFrame {
+    background: $card;
+    border-radius: 15px;
+    padding: 10px;
+}
+
+QFrame#chartFrame QChartView {
+    background: transparent;
+}
+""")
+
+current_theme = "default"
+
+
+@lru_cache(maxsize=None)
+def font(size, weight=None):
+    if weight is None:
+        return QFont(FONT_FAMILY, size)
+    return QFont(FONT_FAMILY, size, weight)
+
+
+@lru_cache(maxsize=None)
+def title_font_family():
+    font_path = resources.path('sources/fonts/try-clother.ttf')
+    font_id = QFontDatabase.addApplicationFont(font_path)
+    return QFontDatabase.applicationFontFamilies(font_id)[0] if font_id != -1 else FONT_FAMILY
+
+
+def color(key, theme=None):
+    return QColor(*THEMES[theme or current_theme][key])
+
+
+def window_palette(height, theme=None):
+    # Resolved here so the cache is keyed on the theme actually used.
+    return _window_palette(height, theme or current_theme)
+
+
+@lru_cache(maxsize=None)
+def _window_palette(height, theme):
+    palette = QPalette(QApplication.palette())
+    gradient = QLinearGradient(0, 0, 0, height)
+    gradient.setColorAt(0, color("gradient_top", theme))
+    gradient.setColorAt(1, color("gradient_bottom", theme))
+    palette.setBrush(QPalette.ColorRole.Window, QBrush(gradient))
+    return palette
+
+
+def set_window_palette(widget):
+    # The height is kept so apply() can rebuild the same gradient in another theme.
+    widget.setProperty("gradientHeight", widget.height())
+    widget.setAutoFillBackground(True)
+    widget.setPalette(window_palette(widget.height()))
+
+
+@lru_cache(maxsize=None)
+def base_stylesheet():
+    return resources.read_text("style.qss")
+
+
+@lru_cache(maxsize=None)
+def compile_stylesheet(theme="default"):
+    values = {key: value for key, value in THEMES[theme].items() if isinstance(value, str)}
+    values["title_font"] = title_font_family()
+    return base_stylesheet() + "\n" + WIDGETS_QSS.substitute(values)
+
+
+def apply(theme=None):
+    global current_theme
+    previous = current_theme
+    current_theme = theme or current_theme
+    app = QApplication.instance()
+    stylesheet = compile_stylesheet(current_theme)
+    # Re-setting an identical sheet would still re-polish every widget.
+    if app.styleSheet() != stylesheet:
+        app.setStyleSheet(stylesheet)
+    if current_theme != previous:
+        for widget in app.allWidgets():
+            height = widget.property("gradientHeight")
+            if height is not None:
+                widget.setPalette(window_palette(height))
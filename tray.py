@@ -0,0 +1,58 @@
+import resources
+from PyQt6.QtWidgets import QSystemTrayIcon, QMenu
+from PyQt6.QtGui import QIcon, QAction
+
+class TrayIcon(QSystemTrayIcon):
+    def __init__(self, window):
+        super().__init__(window)
+        self.window = window
+        self.current_language = window.search_screen.current_language
+        self.translations = {
+            "RU": {
+                "open": "Открыть",
+                "quit": "Выход",
+                "alert": "Погодное предупреждение: {city}"
+            },
+            "EN": {
+                "open": "Open",
+                "quit": "Quit",
+                "alert": "Weather alert: {city}"
+            }
+        }
+
+        self.setIcon(QIcon(resources.path('sources/icons/location.png')))
+        self.setToolTip('Weather4You')
+
+        self.menu = QMenu()
+        self.open_action = QAction(self.menu)
+        self.open_action.triggered.connect(self.window.show_window)
+        self.quit_action = QAction(self.menu)
+        self.quit_action.triggered.connect(self.window.quit)
+        self.menu.addAction(self.open_action)
+        self.menu.addSeparator()
+        self.menu.addAction(self.quit_action)
+        self.setContextMenu(self.menu)
+        self.update_texts()
+
+        self.activated.connect(self.on_activated)
+        window.search_screen.language_changed.connect(self.change_language)
+
+    def change_language(self, language):
+        self.current_language = language
+        self.update_texts()
+
+    def update_texts(self):
+        trans = self.translations[self.current_language]
+        self.open_action.setText(trans["open"])
+        self.quit_action.setText(trans["quit"])
+
+    def on_activated(self, reason):
+        if reason in (QSystemTrayIcon.ActivationReason.Trigger,
+                      QSystemTrayIcon.ActivationReason.DoubleClick):
+            self.window.show_window()
+
+    def show_alert(self, city, alert):
+        trans = self.translations[self.current_language]
+        self.showMessage(trans["alert"].format(city=city),
+                         f"{alert.event}\n{alert.period()}",
+                         QSystemTrayIcon.MessageIcon.Warning, 15000)
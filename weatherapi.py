@@ -0,0 +1,177 @@
+import sys
+import os
+import time
+import threading
+import requests
+from models import CurrentConditions, ForecastSeries, Alert
+from concurrent.futures import ThreadPoolExecutor
+
+@staticmethod
+def resource_path(relative):
+    if hasattr(sys, "_MEIPASS"):
+        return os.path.join(sys._MEIPASS, relative)
+    return os.path.join(relative)
+
+api_key_path = resource_path("api.txt")
+try:
+    with open(api_key_path, "r") as f:
+        api_key_from_conf = f.read().strip()
+except Exception:
+    api_key_from_conf = ""
+
+CACHE_TTL = 600
+_local = threading.local()
+
+
+def api_lang(language):
+    return 'ru' if language == 'RU' else 'en'
+
+
+def get_session():
+    # requests.Session is not safe to share between threads, so every
+    # fetching thread keeps its own pooled connection.
+    session = getattr(_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        _local.session = session
+    return session
+
+
+class WeatherCache:
+    def __init__(self, ttl=CACHE_TTL):
+        self.ttl = ttl
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, key, max_age=None):
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        limit = self.ttl if max_age is None else max_age
+        if limit is not None and time.monotonic() - stored_at > limit:
+            return None
+        return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+cache = WeatherCache()
+geo_cache = WeatherCache(ttl=None)
+
+
+def fetch_weather(city, language, max_age=None):
+    if not api_key_from_conf:
+        return None
+
+    key = ("weather", city.lower(), language)
+    if (cached := cache.get(key, max_age)) is not None:
+        return cached
+
+    try:
+        url = f"https://api.openweathermap.org/data/2.5/weather?q={city}&appid={api_key_from_conf}&units=metric&lang={api_lang(language)}"
+        response = get_session().get(url, timeout=10)
+        data = response.json()
+
+        if data.get("cod") != 200:
+            return None
+
+        weather_data = CurrentConditions.from_weather(data)
+        cache.put(key, weather_data)
+        return weather_data
+
+    except Exception:
+        return None
+
+
+def geocode(city):
+    if (cached := geo_cache.get(city.lower())) is not None:
+        return cached
+
+    geo_url = f"http://api.openweathermap.org/geo/1.0/direct?q={city}&limit=1&appid={api_key_from_conf}"
+    geo_response = get_session().get(geo_url, timeout=10)
+    geo_data = geo_response.json()
+
+    if not geo_data:
+        return None
+
+    coords = (geo_data[0]["lat"], geo_data[0]["lon"])
+    geo_cache.put(city.lower(), coords)
+    return coords
+
+
+def fetch_week_weather(city, language, max_age=None):
+    if not api_key_from_conf:
+        return None
+
+    key = ("forecast", city.lower(), language)
+    if (cached := cache.get(key, max_age)) is not None:
+        return cached
+
+    try:
+        coords = geocode(city)
+        if not coords:
+            return None
+
+        lat, lon = coords
+
+        url = f"https://api.openweathermap.org/data/3.0/onecall?lat={lat}&lon={lon}&units=metric&exclude=hourly,minutely&appid={api_key_from_conf}&lang={api_lang(language)}"
+        response = get_session().get(url, timeout=10)
+        data = response.json()
+
+        forecast_data = ForecastSeries.from_onecall(city, data)
+        cache.put(key, forecast_data)
+        return forecast_data
+
+    except Exception:
+        return None
+
+
+def fetch_alerts(city, language, etag=None):
+    # Returns (alerts, etag); alerts is None when the server answered 304.
+    if not api_key_from_conf:
+        return [], None
+
+    coords = geocode(city)
+    if not coords:
+        return [], None
+
+    lat, lon = coords
+    url = f"https://api.openweathermap.org/data/3.0/onecall?lat={lat}&lon={lon}&exclude=current,minutely,hourly,daily&appid={api_key_from_conf}&lang={api_lang(language)}"
+    headers = {"If-None-Match": etag} if etag else {}
+    response = get_session().get(url, headers=headers, timeout=10)
+    if response.status_code == 304:
+        return None, etag
+    response.raise_for_status()
+
+    data = response.json()
+    alerts = [Alert.from_onecall(alert) for alert in data.get("alerts", [])]
+    return alerts, response.headers.get("ETag")
+
+
+def fetch_city(city, language, max_age=None):
+    return city, fetch_weather(city, language, max_age), fetch_week_weather(city, language, max_age)
+
+
+def unique_cities(cities):
+    return list(dict.fromkeys(city.strip() for city in cities if city.strip()))
+
+
+def fetch_many(cities, language, workers=8, max_age=None):
+    # A max_age below CACHE_TTL refetches entries that are about to expire.
+    unique = unique_cities(cities)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(lambda city: fetch_city(city, language, max_age), unique))
+
+
+def fetch_forecasts(cities, language, workers=8):
+    unique = unique_cities(cities)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(lambda city: fetch_week_weather(city, language), unique))
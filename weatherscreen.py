@@ -1,19 +1,13 @@
 import datetime
-import os
-import sys
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame, 
     QPushButton, QSizePolicy, QSpacerItem
 )
-from PyQt6.QtGui import QFont, QPainter, QIcon, QColor, QLinearGradient, QBrush, QPalette
+from PyQt6.QtGui import QFont, QPainter, QIcon, QColor, QBrush
 from PyQt6.QtCore import Qt, QPointF, QSize
 from PyQt6.QtCharts import QChart, QChartView, QLineSeries, QCategoryAxis,QValueAxis
-
-@staticmethod
-def resource_path(relative):
-    if hasattr(sys, "_MEIPASS"):
-        return os.path.join(sys._MEIPASS, relative)
-    return os.path.join(relative)
+import theme
+import resources
 
 class ShowWeather(QWidget):
     def __init__(self, stacked_widget, search_screen):
@@ -31,6 +25,7 @@ class ShowWeather(QWidget):
                 "temp": "Температура (°C)",
                 "days": ["Пн", "Вт", "Ср", "Чт", "Пт", "Сб", "Вс"],
                 "days_title": "Дни",
+                "compare": "Сравнить",
                 "months": [
                     "Январь", "Февраль", "Март", "Апрель", "Май", "Июнь",
                     "Июль", "Август", "Сентябрь", "Октябрь", "Ноябрь", "Декабрь"
@@ -44,6 +39,7 @@ class ShowWeather(QWidget):
                 "temp": "Temperature (°C)",
                 "days": ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"],
                 "days_title": "Days",
+                "compare": "Compare",
                 "months": [
                     "January", "February", "March", "April", "May", "June",
                     "July", "August", "September", "October", "November", "December"
@@ -66,6 +62,7 @@ class ShowWeather(QWidget):
         self.feels_like_label.setText(f"{trans['feelslike']} --°C")
         self.wind_label.setText(f"{trans['wind']} -- м/с")
         self.humidity_label.setText(f"{trans['hum']} --%")
+        self.compare_button.setText(trans["compare"])
         
         if hasattr(self, 'chart_view') and self.chart_view.chart():
             self.chart_view.chart().setTitle(trans['tempforweek'])
@@ -88,76 +85,73 @@ class ShowWeather(QWidget):
         main_layout.setSpacing(15)
         main_layout.setContentsMargins(20, 20, 20, 20)
         
-        self.setAutoFillBackground(True)
-        palette = self.palette()
-        gradient = QLinearGradient(0, 0, 0, self.height())
-        gradient.setColorAt(0, QColor(30, 80, 150))
-        gradient.setColorAt(1, QColor(15, 40, 75))
-        palette.setBrush(QPalette.ColorRole.Window, QBrush(gradient))
-        self.setPalette(palette)
+        theme.set_window_palette(self)
         
         top_row = QHBoxLayout()
         top_row.setContentsMargins(0, 0, 0, 10)
         
         self.back_button = QPushButton()
-        backbutton_icon_path = resource_path(os.path.join('sources/icons/', 'home.png'))
+        backbutton_icon_path = resources.path('sources/icons/home.png')
         self.back_button.setIcon(QIcon(backbutton_icon_path))
         self.back_button.setIconSize(QSize(30, 30))
         self.back_button.clicked.connect(lambda: self.stacked_widget.setCurrentIndex(0))
-        top_row.addWidget(self.back_button)
+
+        self.compare_button = QPushButton(self.translations[self.current_language]["compare"])
+        self.compare_button.setObjectName("compareButton")
+        self.compare_button.clicked.connect(lambda: self.stacked_widget.setCurrentIndex(2))
+
+        buttons_layout = QHBoxLayout()
+        buttons_layout.addWidget(self.back_button)
+        buttons_layout.addWidget(self.compare_button)
+        buttons_layout.addStretch(1)
+        top_row.addLayout(buttons_layout, stretch=1)
         
         self.location_label = QLabel("Город")
-        self.location_label.setFont(QFont('Arial', 18, QFont.Weight.Bold))
-        self.location_label.setStyleSheet("color: white;")
+        self.location_label.setFont(theme.font(18, QFont.Weight.Bold))
+        self.location_label.setProperty("textRole", "primary")
         top_row.addWidget(self.location_label, alignment=Qt.AlignmentFlag.AlignCenter)
         
         self.date_label = QLabel(datetime.datetime.now().strftime("%d %B %Y"))
-        self.date_label.setFont(QFont('Arial', 14))
-        self.date_label.setStyleSheet("color: rgba(255, 255, 255, 0.8);")
-        top_row.addWidget(self.date_label, alignment=Qt.AlignmentFlag.AlignRight)
+        self.date_label.setFont(theme.font(14))
+        self.date_label.setObjectName("dateLabel")
+        top_row.addWidget(self.date_label, stretch=1, alignment=Qt.AlignmentFlag.AlignRight)
         
         main_layout.addLayout(top_row)
 
         current_weather_frame = QFrame()
-        current_weather_frame.setStyleSheet("""
-            QFrame {
-                background: rgba(255, 255, 255, 0.1);
-                border-radius: 15px;
-                padding: 10px;
-            }
-        """)
+        current_weather_frame.setObjectName("currentWeatherFrame")
         current_layout = QHBoxLayout(current_weather_frame)
         current_layout.setContentsMargins(5, 5, 5, 5)
         
         self.current_temp_label = QLabel("--°C")
-        self.current_temp_label.setFont(QFont('Arial', 42, QFont.Weight.Bold))
-        self.current_temp_label.setStyleSheet("color: white;")
+        self.current_temp_label.setFont(theme.font(42, QFont.Weight.Bold))
+        self.current_temp_label.setProperty("textRole", "primary")
         current_layout.addWidget(self.current_temp_label, alignment=Qt.AlignmentFlag.AlignLeft)
         
         separator = QFrame()
         separator.setFrameShape(QFrame.Shape.VLine)
-        separator.setStyleSheet("color: rgba(255, 255, 255, 0.3);")
+        separator.setObjectName("separator")
         current_layout.addWidget(separator)
         
         params_layout = QVBoxLayout()
         params_layout.setSpacing(8)
         
         self.weather_desc_label = QLabel("--")
-        self.weather_desc_label.setFont(QFont('Arial', 14, QFont.Weight.Medium))
-        self.weather_desc_label.setStyleSheet("color: white;")
+        self.weather_desc_label.setFont(theme.font(14, QFont.Weight.Medium))
+        self.weather_desc_label.setProperty("textRole", "primary")
         
         trans = self.translations[self.current_language]
         self.feels_like_label = QLabel(f"{trans['feelslike']} --°C")
-        self.feels_like_label.setFont(QFont('Arial', 12))
-        self.feels_like_label.setStyleSheet("color: rgba(255, 255, 255, 0.9);")
+        self.feels_like_label.setFont(theme.font(12))
+        self.feels_like_label.setProperty("textRole", "secondary")
         
         self.wind_label = QLabel(f"{trans['wind']} -- м/с")
-        self.wind_label.setFont(QFont('Arial', 12))
-        self.wind_label.setStyleSheet("color: rgba(255, 255, 255, 0.9);")
+        self.wind_label.setFont(theme.font(12))
+        self.wind_label.setProperty("textRole", "secondary")
         
         self.humidity_label = QLabel(f"{trans['hum']} --%")
-        self.humidity_label.setFont(QFont('Arial', 12))
-        self.humidity_label.setStyleSheet("color: rgba(255, 255, 255, 0.9);")
+        self.humidity_label.setFont(theme.font(12))
+        self.humidity_label.setProperty("textRole", "secondary")
         
         for label in [self.weather_desc_label, self.feels_like_label, 
                      self.wind_label, self.humidity_label]:
@@ -167,13 +161,7 @@ class ShowWeather(QWidget):
         main_layout.addWidget(current_weather_frame)
 
         weekly_frame = QFrame()
-        weekly_frame.setStyleSheet("""
-            QFrame {
-                background: rgba(255, 255, 255, 0.1);
-                border-radius: 15px;
-                padding: 6px;
-            }
-        """)
+        weekly_frame.setObjectName("weeklyFrame")
         weekly_layout = QHBoxLayout(weekly_frame)
         weekly_layout.setSpacing(5)
         weekly_layout.setContentsMargins(5, 5, 5, 5)
@@ -181,32 +169,24 @@ class ShowWeather(QWidget):
         self.daily_widgets = []
         for i in range(7):
             day_frame = QFrame()
-            day_frame.setStyleSheet("""
-                QFrame {
-                    background: transparent;
-                }
-                QFrame:hover {
-                    background: rgba(255, 255, 255, 0.05);
-                    border-radius: 10px;
-                }
-            """)
+            day_frame.setObjectName("dayCard")
             day_layout = QVBoxLayout(day_frame)
             day_layout.setSpacing(5)
             day_layout.setContentsMargins(5, 5, 5, 5)
             
             day_name = QLabel("--")
-            day_name.setFont(QFont('Arial', 12, QFont.Weight.Bold))
-            day_name.setStyleSheet("color: white;")
+            day_name.setFont(theme.font(12, QFont.Weight.Bold))
+            day_name.setProperty("textRole", "primary")
             day_name.setAlignment(Qt.AlignmentFlag.AlignCenter)
             
             day_temp = QLabel("--/--°C")
-            day_temp.setFont(QFont('Arial', 12))
-            day_temp.setStyleSheet("color: rgba(255, 255, 255, 0.9);")
+            day_temp.setFont(theme.font(12))
+            day_temp.setProperty("textRole", "secondary")
             day_temp.setAlignment(Qt.AlignmentFlag.AlignCenter)
             
             day_desc = QLabel("--")
-            day_desc.setFont(QFont('Arial', 10))
-            day_desc.setStyleSheet("color: rgba(255, 255, 255, 0.7);")
+            day_desc.setFont(theme.font(10))
+            day_desc.setProperty("textRole", "muted")
             day_desc.setAlignment(Qt.AlignmentFlag.AlignCenter)
             
             day_layout.addWidget(day_name)
@@ -219,19 +199,12 @@ class ShowWeather(QWidget):
         main_layout.addWidget(weekly_frame, stretch=1)
 
         chart_frame = QFrame()
-        chart_frame.setStyleSheet("""
-            QFrame {
-                background: rgba(255, 255, 255, 0.1);
-                border-radius: 15px;
-                padding: 10px;
-            }
-        """)
+        chart_frame.setObjectName("chartFrame")
         chart_layout = QVBoxLayout(chart_frame)
         chart_layout.setContentsMargins(0, 0, 0, 0)
         
         self.chart_view = QChartView()
         self.chart_view.setRenderHint(QPainter.RenderHint.Antialiasing)
-        self.chart_view.setStyleSheet("background: transparent;")
         chart_layout.addWidget(self.chart_view)
         
         main_layout.addWidget(chart_frame, stretch=2)
@@ -247,7 +220,7 @@ class ShowWeather(QWidget):
         chart = QChart()
         trans = self.translations[self.current_language]
         chart.setTitle(trans["tempforweek"])
-        chart.setTitleFont(QFont('Arial', 12, QFont.Weight.Medium))
+        chart.setTitleFont(theme.font(12, QFont.Weight.Medium))
         chart.setTitleBrush(QBrush(QColor(255, 255, 255)))
         chart.legend().hide()
         chart.setBackgroundBrush(QBrush(QColor(0, 0, 0, 0)))
@@ -260,7 +233,7 @@ class ShowWeather(QWidget):
             axisX.append(day, i)
         axisX.setRange(0, 6)
         axisX.setTitleText(trans["days_title"])
-        axisX.setTitleFont(QFont('Arial', 10))
+        axisX.setTitleFont(theme.font(10))
         axisX.setLabelsColor(QColor(255, 255, 255))
         axisX.setTitleBrush(QBrush(QColor(255, 255, 255)))
         axisX.setGridLineColor(QColor(255, 255, 255, 30))
@@ -268,7 +241,7 @@ class ShowWeather(QWidget):
         axisY = QValueAxis()
         axisY.setRange(0, 30)
         axisY.setTitleText(trans["temp"])
-        axisY.setTitleFont(QFont('Arial', 10))
+        axisY.setTitleFont(theme.font(10))
         axisY.setLabelsColor(QColor(255, 255, 255))
         axisY.setTitleBrush(QBrush(QColor(255, 255, 255)))
         axisY.setGridLineColor(QColor(255, 255, 255, 30))
@@ -281,12 +254,12 @@ class ShowWeather(QWidget):
     def update_current_weather(self, weather_data):
         trans = self.translations[self.current_language]
         
-        self.location_label.setText(weather_data["city"])
-        self.current_temp_label.setText(f"{round(weather_data['temp'])}°C")
-        self.weather_desc_label.setText(weather_data["description"].capitalize())
-        self.feels_like_label.setText(f"{trans['feelslike']} {round(weather_data['feels_like'])}°C")
-        self.wind_label.setText(f"{trans['wind']} {weather_data['wind']} м/с")
-        self.humidity_label.setText(f"{trans['hum']} {weather_data['humidity']}%")
+        self.location_label.setText(weather_data.city)
+        self.current_temp_label.setText(f"{round(weather_data.temp)}°C")
+        self.weather_desc_label.setText(weather_data.description.capitalize())
+        self.feels_like_label.setText(f"{trans['feelslike']} {round(weather_data.feels_like)}°C")
+        self.wind_label.setText(f"{trans['wind']} {weather_data.wind} м/с")
+        self.humidity_label.setText(f"{trans['hum']} {weather_data.humidity}%")
         
         self.update_date_label()
     
@@ -294,14 +267,14 @@ class ShowWeather(QWidget):
         temps = []
         trans = self.translations[self.current_language]
         
-        for i, day in enumerate(forecast_data["daily"][:7]):
+        for i, day in enumerate(forecast_data[:7]):
             day_name, day_temp, day_desc = self.daily_widgets[i]
             
             day_name.setText(trans["days"][i])
-            day_temp.setText(f"{round(day['temp_day'])}/{round(day['temp_night'])}°C")
-            day_desc.setText(day["description"].capitalize())
+            day_temp.setText(f"{round(day.temp_day)}/{round(day.temp_night)}°C")
+            day_desc.setText(day.description.capitalize())
             
-            temps.append(day["temp_day"])
+            temps.append(day.temp_day)
         
         self.update_chart(temps)
     
@@ -309,7 +282,7 @@ class ShowWeather(QWidget):
         chart = QChart()
         trans = self.translations[self.current_language]
         chart.setTitle(trans["tempforweek"])
-        chart.setTitleFont(QFont('Arial', 12, QFont.Weight.Medium))
+        chart.setTitleFont(theme.font(12, QFont.Weight.Medium))
         chart.setTitleBrush(QBrush(QColor(255, 255, 255)))
         chart.legend().hide()
         chart.setBackgroundBrush(QBrush(QColor(0, 0, 0, 0)))
@@ -333,7 +306,7 @@ class ShowWeather(QWidget):
             axisX.append(day, i)
         axisX.setRange(0, 6)
         axisX.setTitleText(trans["days_title"])
-        axisX.setTitleFont(QFont('Arial', 10))
+        axisX.setTitleFont(theme.font(10))
         axisX.setLabelsColor(QColor(255, 255, 255))
         axisX.setTitleBrush(QBrush(QColor(255, 255, 255)))
         axisX.setGridLineColor(QColor(255, 255, 255, 30))
@@ -343,7 +316,7 @@ class ShowWeather(QWidget):
         max_temp = max(temperatures)
         axisY.setRange(min_temp - 2, max_temp + 2)
         axisY.setTitleText(trans["temp"])
-        axisY.setTitleFont(QFont('Arial', 10))
+        axisY.setTitleFont(theme.font(10))
         axisY.setLabelsColor(QColor(255, 255, 255))
         axisY.setTitleBrush(QBrush(QColor(255, 255, 255)))
         axisY.setGridLineColor(QColor(255, 255, 255, 30))